@@ -24,10 +24,11 @@ from save.checkpoint import PyTreeNodeTrainStateFlaxCheckpointer
 
 from kitae.algos.factory import explore_general_factory
 from kitae.algos.experience import ExperiencePipeline
-from kitae.buffer import Experience, numpy_stack_experiences
+from kitae.buffer import Experience
 from kitae.config import AlgoConfig, ConfigSerializable
 from kitae.interface import IAgent, IBuffer, AlgoType
 from kitae.loops.train import vectorized_train
+from kitae.loops.update import update_epochs
 from kitae.types import ActionType, ObsType
 
 
@@ -77,6 +78,7 @@ class BaseAgent(IAgent, SerializableObject, Seeded):
         experience_type: bool = Experience,
     ):
         Seeded.__init__(self, config.seed)
+        self.host_seed = config.seed
 
         self.run_name = run_name
         self.config = config
@@ -104,6 +106,20 @@ class BaseAgent(IAgent, SerializableObject, Seeded):
 
         self.update_step_fn = update_step_factory(config)
 
+        def update_fn(state, key, sample):
+            key_process, key_update = jax.random.split(key)
+            experience = self.experience_pipeline.run(state, key_process, sample)
+            return update_epochs(
+                key_update,
+                state,
+                experience,
+                self.update_step_fn,
+                n_epochs=config.update_cfg.n_epochs,
+            )
+
+        # the previous state is never reused after an update
+        self.update_fn = jax.jit(update_fn, donate_argnums=(0,))
+
         # Saving
         path = Path("./runs/").joinpath(run_name).resolve()
         self.agent_info = AgentInfo(
@@ -127,22 +143,22 @@ class BaseAgent(IAgent, SerializableObject, Seeded):
         return self.explore(observation)
 
     def update(self, buffer: IBuffer) -> dict:
+        """Updates the agent's state from a sample of the buffer.
+
+        The experience processing and all the epochs run in a single jitted call,
+        where `update_step_fn` is scanned over the epochs with `jax.lax.scan`. As
+        such, `update_step_fn` must be traceable and return an info dictionary
+        with the same structure at every epoch.
+
+        Returns:
+            The info dictionary averaged over the epochs.
+        """
         _t = time.time()
         sample = buffer.sample(self.config.update_cfg.batch_size)
-        sample = numpy_stack_experiences(sample)
         GeneralLogger.debug(f"Buffer Sampled in {time.time() - _t}s")
 
         _t = time.time()
-        experience = jax.jit(self.experience_pipeline.run)(
-            self.state, self.nextkey(), sample
-        )
-        GeneralLogger.debug(f"Experience Processed in {time.time() - _t}s")
-
-        _t = time.time()
-        for _ in range(self.config.update_cfg.n_epochs):
-            self.state, info = self.update_step_fn(
-                self.state, self.nextkey(), experience
-            )
+        self.state, info = self.update_fn(self.state, self.nextkey(), sample)
         GeneralLogger.debug(f"State Updated in {time.time() - _t}s")
 
         return info
@@ -159,7 +175,7 @@ class BaseAgent(IAgent, SerializableObject, Seeded):
 
     def train(self, env, n_env_steps):
         return vectorized_train(
-            int(jax.random.key_data(self.nextkey())[0]),
+            self.next_host_seed(),
             self,
             env,
             n_env_steps,
@@ -171,7 +187,7 @@ class BaseAgent(IAgent, SerializableObject, Seeded):
     def resume(self, env, n_env_steps):
         step, self.state = self.checkpointer.restore_last(self.state)
         return vectorized_train(
-            int(jax.random.key_data(self.nextkey())[0]),
+            self.next_host_seed(),
             self,
             env,
             n_env_steps,
@@ -181,9 +197,18 @@ class BaseAgent(IAgent, SerializableObject, Seeded):
             start_step=step,
         )
 
+    def next_host_seed(self) -> int:
+        """Returns a new int seed for host-side randomness (eg. environments).
+
+        Contrary to `nextkey`, this does not read a key back from the device.
+        """
+        self.host_seed += 1
+        return self.host_seed
+
     def interact_keys(self, observation: ObsType) -> jax.Array | dict[str : jax.Array]:
         if self.parallel:
-            return {a: self.nextkey() for a in observation.keys()}
+            keys = jax.random.split(self.nextkey(), len(observation))
+            return dict(zip(observation.keys(), keys))
         return self.nextkey()
 
     @classmethod
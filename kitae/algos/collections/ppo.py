@@ -55,6 +55,7 @@ class PPOParams(AlgoParams):
     entropy_coef: float = 0.1
     value_coef: float = 0.5
     normalize: bool = True
+    mixed_precision: bool = False
 
 
 def train_state_ppo_factory(
@@ -70,9 +71,11 @@ def train_state_ppo_factory(
     hidden_shape = (512,) if len(observation_shape) == 3 else (256,)
     action_shape = config.env_cfg.action_space.shape
 
+    # policy and value heads, hence the losses, stay in float32
     encoder = encoder_factory(
         config.env_cfg.observation_space,
         preprocess_fn=preprocess_fn,
+        dtype=jnp.bfloat16 if config.algo_params.mixed_precision else jnp.float32,
     )
     policy_output = policy_output_factory(config.env_cfg.action_space)
     n_actions = (
@@ -154,16 +157,18 @@ def process_experience_factory(config: AlgoConfig) -> ProcessExperienceFn:
         state: PPOState, key: PRNGKeyArray, experience: Experience
     ) -> PPOState:
 
-        all_obs = jnp.concatenate(
-            [experience.observation, experience.next_observation[-1:]], axis=0
-        )
-        all_hiddens = state.encoder_state.apply_fn(state.encoder_state.params, all_obs)
-        if not isinstance(all_hiddens, tuple):
-            all_hiddens = (all_hiddens,)
-        all_values = state.value_state.apply_fn(state.value_state.params, *all_hiddens)
+        def value_fn(observations: jax.Array) -> jax.Array:
+            hiddens = state.encoder_state.apply_fn(
+                state.encoder_state.params, observations
+            )
+            if not isinstance(hiddens, tuple):
+                hiddens = (hiddens,)
+            return state.value_state.apply_fn(state.value_state.params, *hiddens)
 
-        values = all_values[:-1]
-        next_values = all_values[1:]
+        # only the last next_observation is not already in observations
+        values = value_fn(experience.observation)
+        last_value = value_fn(experience.next_observation[-1:])
+        next_values = jnp.concatenate([values[1:], last_value], axis=0)
 
         not_dones = 1.0 - experience.done[..., None]
         discounts = algo_params.gamma * not_dones
@@ -220,7 +225,7 @@ def update_policy_value_factory(config: AlgoConfig) -> UpdateFn:
             )
 
             loss = loss_policy + algo_params.value_coef * loss_value
-            info = info_policy | info_value
+            info = info_policy._asdict() | info_value._asdict()
             info["total_loss"] = loss
 
             return loss, info
@@ -12,7 +12,7 @@ import optax
 from jrd_extensions import PRNGSequence
 
 from kitae.agent import OffPolicyAgent
-from kitae.buffer import OffPolicyBuffer, Experience, numpy_stack_experiences
+from kitae.buffer import OffPolicyBuffer, Experience
 from kitae.config import AlgoConfig, AlgoParams
 
 from kitae.operations.timesteps import compute_td_targets
@@ -283,6 +283,9 @@ class TD3(OffPolicyAgent):
             experience_type=Experience,
         )
 
+        # TD3 updates the policy conditionally, so it does not use self.update_fn
+        self.process_experience_fn = jax.jit(self.experience_pipeline.run)
+
     def select_action(self, observation: jax.Array) -> tuple[jax.Array, jax.Array]:
         keys = self.interact_keys(observation)
         action, log_prob = self.explore_fn(self.state, keys, observation)
@@ -307,11 +310,8 @@ class TD3(OffPolicyAgent):
 
     def update(self, buffer: OffPolicyBuffer) -> dict:
         sample = buffer.sample(self.config.update_cfg.batch_size)
-        sample = numpy_stack_experiences(sample)
 
-        experience = jax.jit(self.experience_pipeline.run)(
-            self.state, self.nextkey(), sample
-        )
+        experience = self.process_experience_fn(self.state, self.nextkey(), sample)
 
         update_policy = self.step % self.config.algo_params.policy_update_frequency == 0
         for _ in range(self.config.update_cfg.n_epochs):
@@ -27,7 +27,7 @@ def merge_n_first_dims(array: jax.Array, n: int = 2) -> jax.Array:
         AssertionError: If n is not specified as static when jitting.
     """
     chex.assert_scalar_non_negative(n - 1)
-    return jnp.reshape(array, (-1, *array.shape[n:]))
+    return jax.lax.collapse(array, 0, min(n, array.ndim))
 
 
 # When jitting, n should be specified as a static argument
@@ -81,6 +81,32 @@ def dict_to_tuple(experience: dict[str, NamedTuple]) -> NamedTuple:
     return _cls(*_args)
 
 
+def get_agents(experience: NamedTuple) -> tuple[str, ...]:
+    """Returns the agents of a tuple of dictionaries as an ordered tuple.
+
+    Raises:
+        AttributeError: If the fields of the tuple are not dictionaries.
+    """
+    return tuple(experience[0].keys())
+
+
+def stack_agents(
+    experience: NamedTuple, agents: Sequence[str] | None = None
+) -> NamedTuple:
+    """Stacks the agents of a NamedTuple of dictionaries along a new first axis.
+
+    Eg:
+        `Foo(a={"a": Array_a(T, ...), "b": Array_b(T, ...)})` becomes:
+        `Foo(a=Array(2, T, ...))`
+
+    Agents are stacked in the order of `agents` for every field. If not provided,
+    the order of the first field is used.
+    """
+    _cls = experience.__class__
+    agents = get_agents(experience) if agents is None else agents
+    return _cls(*[jnp.stack([e[a] for a in agents], axis=0) for e in experience])
+
+
 @dataclass
 class ExperiencePipeline:
     """Dataclass for ExperiencePipeline.
@@ -177,18 +203,18 @@ class ExperiencePipeline:
             A processed NamedTuple where keys are merged by concatenating arrays.
         """
         _run_single_pipe = lambda k, e: self.run_single_pipe(state, k, e)
+        # agents are stacked on the first axis, output is (T, A, ...)
+        run_parallel_pipe = jax.vmap(_run_single_pipe, in_axes=(0, 0), out_axes=1)
 
-        keys = {}
-        for agent in experience[0].keys():
-            key, keys[agent] = jax.random.split(key, 2)
+        agents = get_agents(experience)
+        keys = jax.random.split(key, len(agents))
 
-        dict_experience: dict[str, NamedTuple] = tuple_to_dict(experience)
-        processed_experience = jax.tree_map(_run_single_pipe, keys, dict_experience)
+        stacked_experience = stack_agents(experience, agents)
+        processed_experience = run_parallel_pipe(keys, stacked_experience)
 
-        return jax.tree_map(
-            lambda *x: stack_and_merge_n_first_dims(x, 2),
-            *zip(processed_experience.values()),
-        )[0]
+        return jax.tree_util.tree_map(
+            lambda x: merge_n_first_dims(x, 2), processed_experience
+        )
 
     def run_vectorized(
         self, state: AgentPyTree, key: PRNGKeyArray, experience: NamedTuple
@@ -219,7 +245,9 @@ class ExperiencePipeline:
         keys = jax.random.split(key, experience[0].shape[1]).T
         processed_experience = run_vectorized_pipe(keys, experience)
 
-        return jax.tree_map(lambda x: merge_n_first_dims(x, 2), processed_experience)
+        return jax.tree_util.tree_map(
+            lambda x: merge_n_first_dims(x, 2), processed_experience
+        )
 
     def run_parallel_vectorized(
         self, state: AgentPyTree, key: PRNGKeyArray, experience: NamedTuple
@@ -254,17 +282,20 @@ class ExperiencePipeline:
         """
         _run_single_pipe = lambda k, e: self.run_single_pipe(state, k, e)
         run_vectorized_pipe = jax.vmap(_run_single_pipe, in_axes=(0, 1), out_axes=1)
+        # agents are stacked on the first axis, output is (T, A, E, ...)
+        run_parallel_vectorized_pipe = jax.vmap(
+            run_vectorized_pipe, in_axes=(0, 0), out_axes=1
+        )
 
-        keys = {}
-        for agent, value in experience[0].items():
-            # vectorized: shape=(T, n_envs, ...)
-            _keys = jax.random.split(key, value.shape[1] + 1)
-            key, keys[agent] = _keys[0], _keys[1:].T
+        agents = get_agents(experience)
 
-        dict_experience: dict[str, NamedTuple] = tuple_to_dict(experience)
-        processed_experience = jax.tree_map(run_vectorized_pipe, keys, dict_experience)
+        # vectorized: shape=(T, n_envs, ...)
+        n_agents, n_envs = len(agents), experience[0][agents[0]].shape[1]
+        keys = jax.random.split(key, n_agents * n_envs).reshape((n_agents, n_envs))
 
-        return jax.tree_map(
-            lambda *x: stack_and_merge_n_first_dims(x, 3),
-            *zip(processed_experience.values()),
-        )[0]
+        stacked_experience = stack_agents(experience, agents)
+        processed_experience = run_parallel_vectorized_pipe(keys, stacked_experience)
+
+        return jax.tree_util.tree_map(
+            lambda x: merge_n_first_dims(x, 3), processed_experience
+        )
@@ -4,6 +4,8 @@ from typing import Any, Callable
 import jax
 import jax.numpy as jnp
 
+from kitae.algos.experience import get_agents
+
 
 def fn_parallel(fn: Callable) -> Callable:
     """Parallelizes a function for mutliple agents.
@@ -16,25 +18,21 @@ def fn_parallel(fn: Callable) -> Callable:
     The wrapped function returns a list of trees with the same structure as input.
 
     Warning: args must be entered in the same order as in fn to allow vmapping.
+    Warning: the Arrays of all agents must have the same shape, as they are stacked.
     """
 
     def wrapped(state: Any, *trees, **hyperparams):
-        results = jax.tree_util.tree_map(
-            functools.partial(fn, state, **hyperparams), *trees
+        agents = get_agents(trees)
+        stacked_trees = [jnp.stack([t[a] for a in agents], axis=0) for t in trees]
+
+        results = jax.vmap(functools.partial(fn, state, **hyperparams))(
+            *stacked_trees
         )
 
         # transform the structure of results
-        # output = {"agent_0": [out1, out2], "agent_1": [out1, out2]}
-        # -> [{"agent_1": out1, "agent_2": out1}, {"agent_1": out2, "agent_2": out2}]
-
-        n_outputs = len(list(results.values())[0])
-        outputs = [{} for _ in range(n_outputs)]
-
-        for key, value in results.items():
-            for out_pos in range(n_outputs):
-                outputs[out_pos][key] = value[out_pos]
-
-        return outputs
+        # output = (out1[A, ...], out2[A, ...])
+        # -> ({"agent_1": out1, "agent_2": out1}, {"agent_1": out2, "agent_2": out2})
+        return jax.tree_util.tree_map(lambda x: dict(zip(agents, x)), results)
 
     return wrapped
 
@@ -46,14 +44,14 @@ def explore_general_factory(
 
     def input_fn(inputs):
         if not vectorized:
-            return jax.tree_map(lambda x: jnp.expand_dims(x, axis=0), inputs)
+            return jax.tree_util.tree_map(lambda x: jnp.expand_dims(x, axis=0), inputs)
         return inputs
 
     explore_fn = fn_parallel(explore_fn) if parallel else explore_fn
 
     def output_fn(outputs):
         if not vectorized:
-            return jax.tree_map(lambda x: jnp.squeeze(x, axis=0), outputs)
+            return jax.tree_util.tree_map(lambda x: jnp.squeeze(x, axis=0), outputs)
         return outputs
 
     def general_fn(state: Any, key: jax.Array, *trees, **hyperparams):
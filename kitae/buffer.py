@@ -23,7 +23,9 @@ def jax_stack_experiences(experiences: list[Experience]) -> Experience:
         An Experience of the stacked inputs.
     """
     _cls = experiences[0].__class__
-    return _cls(*jax.tree_map(lambda *xs: jnp.stack(xs, axis=0), *experiences))
+    return _cls(
+        *jax.tree_util.tree_map(lambda *xs: jnp.stack(xs, axis=0), *experiences)
+    )
 
 
 def numpy_stack_experiences(experiences: list[Experience]) -> Experience:
@@ -138,35 +140,86 @@ class OffPolicyBuffer(Buffer):
         else:
             self.buffer: list[Experience] = []
 
-    def sample(self, batch_size: int) -> list[Experience]:
+    def sample(self, batch_size: int) -> Experience:
         """Samples from the OffPolicy buffer.
 
         Args:
             batch_size (int): the number of elements to sample.
 
         Returns:
-            A list of transitions as tuples.
+            An Experience of the stacked transitions.
         """
         indices = self.rng.permutation(len(self.buffer))[:batch_size]
-        return [self.buffer[i] for i in indices]
+        return numpy_stack_experiences([self.buffer[i] for i in indices])
 
 
 class OnPolicyBuffer(Buffer):
-    """OnPolicy variant of the buffer class."""
+    """OnPolicy variant of the buffer class.
 
-    def __init__(self, seed: int, max_buffer_size: int = 0) -> None:
-        """Instantiates an OnPolicy buffer."""
+    Transitions are written into arrays of shape [max_buffer_size, ...] that are
+    allocated when the first transition is added, so that sampling does not need
+    to stack them.
+
+    Attributes:
+        buffer (Experience | None): An Experience of preallocated arrays.
+        index (int): The number of transitions in the buffer.
+    """
+
+    def __init__(self, seed: int, max_buffer_size: int) -> None:
+        """Instantiates an OnPolicy buffer.
+
+        Raises:
+            ValueError: if max_buffer_size is not strictly positive.
+        """
+        if max_buffer_size <= 0:
+            raise ValueError(
+                f"max_buffer_size should be strictly positive, got {max_buffer_size}."
+            )
         Buffer.__init__(self, seed=seed, max_buffer_size=max_buffer_size)
 
-        self.buffer = []
+        self.buffer: Experience | None = None
+        self.index = 0
 
-    def sample(self, batch_size: int = -1) -> list[Experience]:
+    def __len__(self) -> int:
+        """Returns the length of the buffer."""
+        return self.index
+
+    def add(self, experience: Experience) -> None:
+        """Writes a transition in the buffer.
+
+        Raises:
+            IndexError: if the buffer already contains max_buffer_size transitions.
+        """
+        if self.buffer is None:
+            self.buffer = jax.tree_util.tree_map(
+                lambda x: np.zeros(
+                    (self.max_buffer_size,) + np.shape(x), dtype=np.asarray(x).dtype
+                ),
+                experience,
+            )
+
+        buffer_leaves = jax.tree_util.tree_leaves(self.buffer)
+        for array, value in zip(buffer_leaves, jax.tree_util.tree_leaves(experience)):
+            array[self.index] = value
+        self.index += 1
+
+    def sample(self, batch_size: int = -1) -> Experience:
         """Samples from the OnPolicy buffer and then empties it.
 
         Returns:
-            A list of transitions as tuples.
+            An Experience of the stacked transitions, of shape [len(buffer), ...].
+
+        Raises:
+            ValueError: if the buffer is empty.
         """
-        sample, self.buffer = self.buffer, []
+        if self.index == 0:
+            raise ValueError("Cannot sample from an empty OnPolicyBuffer.")
+
+        n = self.index
+        sample = jax.tree_util.tree_map(lambda x: x[:n], self.buffer)
+
+        # the next transitions are written into new arrays
+        self.buffer, self.index = None, 0
         return sample
 
 
@@ -20,7 +20,7 @@ class IBuffer(ABC):
     def add(self, experience: type[NamedTuple]) -> None: ...
 
     @abstractmethod
-    def sample(self, sample_size: int) -> list[type[NamedTuple]]: ...
+    def sample(self, sample_size: int) -> type[NamedTuple]: ...
 
 
 class IActor(ABC):
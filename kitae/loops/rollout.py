@@ -0,0 +1,94 @@
+from typing import Any, Callable
+
+import jax
+
+from kitae.buffer import Experience
+from kitae.modules.pytree import AgentPyTree
+from kitae.types import ExploreFn, PRNGKeyArray
+
+
+EnvStepFn = Callable[
+    [Any, PRNGKeyArray, jax.Array],
+    tuple[Any, jax.Array, jax.Array, jax.Array],
+]
+RolloutFn = Callable[
+    [AgentPyTree, PRNGKeyArray, Any, jax.Array],
+    tuple[Any, jax.Array, Experience],
+]
+
+
+def rollout_factory(
+    explore_fn: ExploreFn, env_step_fn: EnvStepFn, *, n_steps: int
+) -> RolloutFn:
+    """Creates a function that collects transitions in an environment written in JAX.
+
+    The whole rollout is a single `jax.lax.scan` over the steps, so exploring,
+    stepping the environment and storing the transitions happen in one jitted call.
+
+    The environment step function should have the following signature:
+    `env_step_fn(env_state, key, action) -> (env_state, observation, reward, done)`
+    and reset the environment itself when an episode is done.
+
+    With multiple agents, the observation is a dict of observations per agent and
+    `explore_fn` receives a dict of keys per agent, as in `BaseAgent.interact_keys`.
+
+    Tip:
+        Typical Usage::
+
+            rollout_fn = rollout_factory(agent.explore_fn, env_step_fn, n_steps=128)
+            env_state, observation, experience = rollout_fn(
+                agent.state, key, env_state, observation
+            )
+            agent.state, info = agent.update_fn(agent.state, key, experience)
+
+    Warning:
+        `agent.update_fn` donates `agent.state`, which cannot be used after the
+        update. Always replace it with the returned state, as above.
+
+    Args:
+        explore_fn: An ExploreFn that returns actions and log_probs.
+        env_step_fn: An EnvStepFn that steps the environment.
+        n_steps: An int that determines the number of steps of a rollout.
+
+    Returns:
+        A jitted function that returns the last environment state and observation,
+        and an Experience of Arrays of shape [n_steps, ...].
+    """
+
+    def rollout_fn(
+        state: AgentPyTree,
+        key: PRNGKeyArray,
+        env_state: Any,
+        observation: jax.Array,
+    ) -> tuple[Any, jax.Array, Experience]:
+
+        def _step(carry: tuple[Any, jax.Array], key: PRNGKeyArray):
+            env_state, observation = carry
+            key_explore, key_step = jax.random.split(key)
+
+            if isinstance(observation, dict):
+                keys = jax.random.split(key_explore, len(observation))
+                key_explore = dict(zip(observation.keys(), keys))
+
+            action, log_prob = explore_fn(state, key_explore, observation)
+            env_state, next_observation, reward, done = env_step_fn(
+                env_state, key_step, action
+            )
+
+            experience = Experience(
+                observation=observation,
+                action=action,
+                reward=reward,
+                done=done,
+                next_observation=next_observation,
+                log_prob=log_prob,
+            )
+            return (env_state, next_observation), experience
+
+        keys = jax.random.split(key, n_steps)
+        (env_state, observation), experience = jax.lax.scan(
+            _step, (env_state, observation), keys
+        )
+        return env_state, observation, experience
+
+    return jax.jit(rollout_fn)
@@ -40,20 +40,50 @@ def update_epoch(
     Returns:
         An updated agent's state and the corresponding loss dictionary.
     """
-    key, _key = jax.random.split(key)
-    batches = batchify_fn(_key, experience, batch_size)
+    key_batchify, key_update = jax.random.split(key)
+    batches = batchify_fn(key_batchify, experience, batch_size)
+    n_batches = jax.tree_util.tree_leaves(batches)[0].shape[0]
+    keys = jax.random.split(key_update, n_batches)
 
     def _update_batch(
-        carry: tuple[PRNGKeyArray, AgentPyTree], batch: tuple[jax.Array, ...]
+        state: AgentPyTree, xs: tuple[PRNGKeyArray, tuple[jax.Array, ...]]
     ):
-        key, state = carry
+        key, batch = xs
         batch = experience_type(*batch)
-        key, _key = jax.random.split(key)
+        return update_batch_fn(state, key, batch)
 
-        state, info = update_batch_fn(state, _key, batch)
-        return (_key, state), info
+    state, info = jax.lax.scan(_update_batch, state, (keys, batches))
+    info = jax.tree_util.tree_map(lambda x: jnp.mean(x), info)
+    return state, info
+
+
+def update_epochs(
+    key: PRNGKeyArray,
+    state: AgentPyTree,
+    experience: ProcessedExperienceTuple,
+    update_step_fn: UpdateStepFn,
+    *,
+    n_epochs: int,
+) -> tuple[AgentPyTree, LossDict]:
+    """Updates a state for multiple epochs.
+
+    This function uses `jax.lax.scan` over the epochs instead of a python loop.
+
+    Args:
+        key: A PRNGKeyArray for reproducibility.
+        state: A AgentPyTree containing the agent's state.
+        experience: An ExperienceTuple containing processed trajectories.
+        update_step_fn: An UpdateStepFn that updates the agent's state for one epoch.
+        n_epochs: An int that determines the number of epochs.
+
+    Returns:
+        An updated agent's state and the loss dictionary averaged over the epochs.
+    """
+
+    def _update_step(state: AgentPyTree, key: PRNGKeyArray):
+        return update_step_fn(state, key, experience)
 
-    init = (key, state)
-    (_, state), info = jax.lax.scan(_update_batch, init, batches)
+    keys = jax.random.split(key, n_epochs)
+    state, info = jax.lax.scan(_update_step, state, keys)
     info = jax.tree_util.tree_map(lambda x: jnp.mean(x), info)
     return state, info
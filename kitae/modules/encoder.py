@@ -13,6 +13,7 @@ from kitae.modules.modules import conv_layer, MLP
 class VisionEncoder(nn.Module):
     rearrange_pattern: str
     preprocess_fn: Callable = None
+    dtype: jnp.dtype = jnp.float32
 
     @nn.compact
     def __call__(self, x: jax.Array):
@@ -20,12 +21,13 @@ class VisionEncoder(nn.Module):
         x = rearrange(x, self.rearrange_pattern)
         if self.preprocess_fn is not None:
             x = self.preprocess_fn(x)
+        x = x.astype(self.dtype)
 
-        x = conv_layer(32, 8, 4)(x)
+        x = conv_layer(32, 8, 4, dtype=self.dtype)(x)
         x = nn.relu(x)
-        x = conv_layer(64, 4, 2)(x)
+        x = conv_layer(64, 4, 2, dtype=self.dtype)(x)
         x = nn.relu(x)
-        x = conv_layer(64, 3, 1)(x)
+        x = conv_layer(64, 3, 1, dtype=self.dtype)(x)
         x = nn.relu(x)
 
         x = jnp.reshape(x, (x.shape[0], -1))
@@ -33,19 +35,22 @@ class VisionEncoder(nn.Module):
             features=512,
             kernel_init=nn.initializers.orthogonal(2.0),
             bias_init=nn.initializers.constant(0.0),
+            dtype=self.dtype,
         )(x)
         return nn.relu(x)
 
 
 class VectorEncoder(nn.Module):
     preprocess_fn: Callable = None
+    dtype: jnp.dtype = jnp.float32
 
     @nn.compact
     def __call__(self, x: jax.Array):
         x = x.astype(jnp.float32)
         if self.preprocess_fn is not None:
             x = self.preprocess_fn(x)
-        return MLP([256, 256], nn.relu, nn.relu)(x)
+        x = x.astype(self.dtype)
+        return MLP([256, 256], nn.relu, nn.relu, dtype=self.dtype)(x)
 
 
 def encoder_factory(
@@ -53,14 +58,23 @@ def encoder_factory(
     *,
     rearrange_pattern: str = "b h w c -> b h w c",
     preprocess_fn: Callable = None,
+    dtype: jnp.dtype = jnp.float32,
 ) -> Type[nn.Module]:
+    """Returns an encoder class adapted to the observation space.
+
+    The parameters of the encoder are always float32, `dtype` only sets the
+    dtype of its computations (eg. jnp.bfloat16 for mixed precision).
+    """
     if len(observation_space.shape) == 1:
-        return functools.partial(VectorEncoder, preprocess_fn=preprocess_fn)
+        return functools.partial(
+            VectorEncoder, preprocess_fn=preprocess_fn, dtype=dtype
+        )
     elif len(observation_space.shape) == 3:
         return functools.partial(
             VisionEncoder,
             rearrange_pattern=rearrange_pattern,
             preprocess_fn=preprocess_fn,
+            dtype=dtype,
         )
     else:
         raise NotImplementedError
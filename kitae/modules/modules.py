@@ -18,12 +18,13 @@ class MLP(nn.Module):
     layers: list[int]
     activation: Callable
     final_activation: Callable
+    dtype: jnp.dtype | None = None
 
     @nn.compact
     def __call__(self, x: jax.Array) -> jax.Array:
         for l in self.layers[:-1]:
-            x = self.activation(nn.Dense(l)(x))
-        return self.final_activation(nn.Dense(self.layers[-1])(x))
+            x = self.activation(nn.Dense(l, dtype=self.dtype)(x))
+        return self.final_activation(nn.Dense(self.layers[-1], dtype=self.dtype)(x))
 
 
 def conv_layer(
@@ -32,6 +33,7 @@ def conv_layer(
     strides: int,
     kernel_init_std: float = np.sqrt(2.0),
     bias_init_cst: float = 0.0,
+    dtype: jnp.dtype | None = None,
 ) -> nn.Conv:
     return nn.Conv(
         features,
@@ -40,6 +42,7 @@ def conv_layer(
         padding="VALID",
         kernel_init=nn.initializers.orthogonal(kernel_init_std),
         bias_init=nn.initializers.constant(bias_init_cst),
+        dtype=dtype,
     )
 
 
@@ -88,6 +91,6 @@ def parallel_copy(module: nn.Module, n: int):
             self.modules = [module for _ in range(n)]
 
         def __call__(self, *xs: Iterable[jax.Array]) -> Iterable[jax.Array]:
-            return jax.tree_map(lambda m: m(*xs), self.modules)
+            return jax.tree_util.tree_map(lambda m: m(*xs), self.modules)
 
     return Module()
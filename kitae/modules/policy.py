@@ -121,14 +121,20 @@ def policy_output_factory(action_space: Discrete) -> type[PolicyOutput]:
 def sample_and_log_prob(
     distribution: dx.Distribution, key: jax.Array
 ) -> tuple[jax.Array, jax.Array]:
-    sample, log_prob = distribution.sample_and_log_prob(seed=key)
     if isinstance(distribution, dx.Categorical):
-        return sample, jnp.expand_dims(log_prob, axis=-1)
+        log_probs = jax.nn.log_softmax(distribution.logits, axis=-1)
+        sample = jax.random.categorical(key, log_probs, axis=-1)
+        return sample, jnp.take_along_axis(log_probs, sample[..., None], axis=-1)
+
+    sample, log_prob = distribution.sample_and_log_prob(seed=key)
     return sample, jnp.sum(log_prob, axis=-1, keepdims=True)
 
 
 def get_log_prob(distribution: dx.Distribution, value: jax.Array) -> jax.Array:
-    log_prob = distribution.log_prob(value)
     if isinstance(distribution, dx.Categorical):
-        return jnp.expand_dims(log_prob, axis=-1)
+        log_probs = jax.nn.log_softmax(distribution.logits, axis=-1)
+        value = value.astype(jnp.int32)[..., None]
+        return jnp.take_along_axis(log_probs, value, axis=-1)
+
+    log_prob = distribution.log_prob(value)
     return jnp.sum(log_prob, axis=-1, keepdims=True)
@@ -1,11 +1,41 @@
 """Collection of loss functions for reinforcement learning."""
 
+from typing import NamedTuple
+
 import chex
 import distrax as dx
 import jax
 import jax.numpy as jnp
 
-from kitae.types import LossDict
+
+class LossPolicyPPOInfo(NamedTuple):
+    loss_policy: jax.Array
+    mean_entropy: jax.Array
+    kl_divergence: jax.Array
+
+
+class LossValueClipInfo(NamedTuple):
+    loss_value: jax.Array
+
+
+def categorical_entropy(logits: jax.Array) -> jax.Array:
+    """Entropy of a categorical distribution parameterized by logits.
+
+    Equivalent to `dx.Categorical(logits=logits).entropy()` without building
+    the distribution. Actions with a probability of 0 (eg. masked with a `-inf`
+    logit) contribute 0 to the entropy.
+
+    Args:
+        logits: An Array of shape (..., N_actions)
+
+    Returns:
+        An Array of shape (...)
+    """
+    log_probs = jax.nn.log_softmax(logits, axis=-1)
+    probs = jnp.exp(log_probs)
+    # avoids 0 * -inf in the value and in the gradient
+    log_probs = jnp.where(probs == 0.0, 0.0, log_probs)
+    return -jnp.sum(probs * log_probs, axis=-1)
 
 
 def loss_policy_ppo(
@@ -15,7 +45,7 @@ def loss_policy_ppo(
     gaes: jax.Array,
     clip_eps: float,
     entropy_coef: float,
-) -> tuple[float, LossDict]:
+) -> tuple[float, LossPolicyPPOInfo]:
     """Proximal Policy Optimization's policy loss function.
 
     Args:
@@ -29,25 +59,33 @@ def loss_policy_ppo(
 
     Returns:
         A float corresponding to the loss value.
-        A LossDict with the following keys: `["loss_policy", "entropy", "kl_divergence"]`
+        A LossPolicyPPOInfo with the policy loss, the mean entropy and the kl divergence.
     """
     chex.assert_equal_shape([log_probs, log_probs_old, gaes])
 
     log_ratios = log_probs - log_probs_old
     ratios = jnp.exp(log_ratios)
 
-    ratios_clip = jnp.clip(ratios, 1 - clip_eps, 1 + clip_eps)
-    loss_policy = -jnp.mean(jnp.fmin(ratios * gaes, ratios_clip * gaes))
-
-    entropy = dist.entropy()
+    # min(r * A, clip(r) * A) is A * min(r, 1 + eps) if A >= 0 else A * max(r, 1 - eps)
+    ratios_bound = jnp.where(
+        gaes >= 0,
+        jnp.minimum(ratios, 1 + clip_eps),
+        jnp.maximum(ratios, 1 - clip_eps),
+    )
+    loss_policy = -jnp.mean(gaes * ratios_bound)
+
+    if isinstance(dist, dx.Categorical):
+        entropy = categorical_entropy(dist.logits)
+    else:
+        entropy = dist.entropy()
     loss_entropy = -jnp.mean(entropy)
 
     kl_divergence = jax.lax.stop_gradient(jnp.mean((ratios - 1) - log_ratios))
-    info = {
-        "loss_policy": loss_policy,
-        "mean_entropy": jnp.mean(entropy),
-        "kl_divergence": kl_divergence,
-    }
+    info = LossPolicyPPOInfo(
+        loss_policy=loss_policy,
+        mean_entropy=jnp.mean(entropy),
+        kl_divergence=kl_divergence,
+    )
 
     return loss_policy + entropy_coef * loss_entropy, info
 
@@ -57,7 +95,7 @@ def loss_value_clip(
     targets: jax.Array,
     values_old: jax.Array,
     clip_eps: float,
-) -> tuple[float, LossDict]:
+) -> tuple[float, LossValueClipInfo]:
     """Clipped value loss function
 
     A clipped value loss ensures smaller updates of the value.
@@ -70,7 +108,7 @@ def loss_value_clip(
 
     Returns:
         A float corresponding to the loss value.
-        A LossDict with the following keys: `["loss_value"]`
+        A LossValueClipInfo with the value loss.
     """
     chex.assert_equal_shape([values, values_old, targets])
 
@@ -79,9 +117,9 @@ def loss_value_clip(
 
     loss_value_unclip = jnp.square(values - targets)
     loss_value_clip = jnp.square(values_clip - targets)
-    loss_value = jnp.mean(jnp.fmax(loss_value_unclip, loss_value_clip))
+    loss_value = jnp.mean(jnp.maximum(loss_value_unclip, loss_value_clip))
 
-    infos = {"loss_value": loss_value}
+    infos = LossValueClipInfo(loss_value=loss_value)
 
     return loss_value, infos
 
@@ -104,4 +142,4 @@ def loss_shannon_jensen_divergence(
         shannon_jensen_divergence_loss: A float
     """
     chex.assert_equal_rank([average_logits, average_entropy])
-    return -jnp.mean(dx.Categorical(logits=average_logits).entropy() - average_entropy)
+    return -jnp.mean(categorical_entropy(average_logits) - average_entropy)
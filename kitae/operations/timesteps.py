@@ -39,8 +39,9 @@ def calculate_gaes_targets(
         acc = tds + discs * _lambda * acc
         return acc, acc
 
-    init = jnp.zeros((1,))
-    xs = [td_errors, discounts]
+    # backward recurrence, the carry has the shape of a single timestep
+    init = jnp.zeros_like(td_errors[-1])
+    xs = (td_errors, discounts)
     _, gaes = jax.lax.scan(_fn, init, xs, reverse=True)
 
     targets = gaes + values
@@ -8,6 +8,8 @@ from kitae.algos.experience import merge_n_first_dims
 from kitae.algos.experience import stack_and_merge_n_first_dims
 from kitae.algos.experience import tuple_to_dict
 from kitae.algos.experience import dict_to_tuple
+from kitae.algos.experience import get_agents
+from kitae.algos.experience import stack_agents
 
 from kitae.algos.experience import ExperiencePipeline
 
@@ -139,6 +141,35 @@ def test_dict_to_tuple():
     assert jnp.array_equal(_foo.b["b"], jnp.zeros((10, 5, 2)) + 3)
 
 
+def test_stack_agents():
+    FooTuple = namedtuple("FooTuple", ["a", "b"])
+    foo = FooTuple(
+        a={"a": jnp.zeros((10,)), "b": jnp.zeros((10,)) + 1},
+        b={"a": jnp.zeros((10, 5, 2)) + 2, "b": jnp.zeros((10, 5, 2)) + 3},
+    )
+
+    _foo = stack_agents(foo)
+    assert isinstance(_foo, FooTuple)
+    assert _foo.a.shape == (2, 10)
+    assert _foo.b.shape == (2, 10, 5, 2)
+    assert jnp.array_equal(_foo.a[0], jnp.zeros((10,)))
+    assert jnp.array_equal(_foo.a[1], jnp.zeros((10,)) + 1)
+    assert jnp.array_equal(_foo.b[0], jnp.zeros((10, 5, 2)) + 2)
+    assert jnp.array_equal(_foo.b[1], jnp.zeros((10, 5, 2)) + 3)
+
+    assert get_agents(foo) == ("a", "b")
+    with pytest.raises(AttributeError):
+        get_agents(FooTuple(a=jnp.zeros((10,)), b=jnp.zeros((10,))))
+
+    _foo = stack_agents(foo, ("b", "a"))
+    assert jnp.array_equal(_foo.a[0], jnp.zeros((10,)) + 1)
+    assert jnp.array_equal(_foo.b[0], jnp.zeros((10, 5, 2)) + 3)
+
+    _foo = jax.jit(stack_agents)(foo)
+    assert jnp.array_equal(_foo.a[1], jnp.zeros((10,)) + 1)
+    assert jnp.array_equal(_foo.b[1], jnp.zeros((10, 5, 2)) + 3)
+
+
 # region Test ExperiencePipeline
 ExperienceNamedTuple = namedtuple("ExperienceNamedTuple", ["field_0", "field_1"])
 
@@ -0,0 +1,69 @@
+import jax
+import jax.numpy as jnp
+
+from kitae.buffer import Experience
+from kitae.loops.rollout import rollout_factory
+
+
+def test_rollout_factory():
+    # a counter that is done and resets after 3 steps
+    def env_step_fn(env_state, key, action):
+        env_state = env_state + action
+        done = env_state >= 3
+        env_state = jnp.where(done, 0, env_state)
+        return env_state, env_state.astype(jnp.float32), jnp.ones_like(action), done
+
+    def explore_fn(state, key, observation):
+        action = jnp.ones(observation.shape, dtype=jnp.int32)
+        return action, jnp.zeros(observation.shape + (1,))
+
+    n_envs = 4
+    rollout_fn = rollout_factory(explore_fn, env_step_fn, n_steps=5)
+
+    env_state = jnp.zeros((n_envs,), dtype=jnp.int32)
+    observation = jnp.zeros((n_envs,))
+    env_state, observation, experience = rollout_fn(
+        None, jax.random.key(0), env_state, observation
+    )
+
+    assert isinstance(experience, Experience)
+    assert experience.observation.shape == (5, n_envs)
+    assert experience.log_prob.shape == (5, n_envs, 1)
+    assert jnp.array_equal(experience.observation[:, 0], jnp.array([0, 1, 2, 0, 1]))
+    assert jnp.array_equal(
+        experience.next_observation[:, 0], jnp.array([1, 2, 0, 1, 2])
+    )
+    assert jnp.array_equal(experience.done[:, 0], jnp.array([0, 0, 1, 0, 0]))
+    assert jnp.array_equal(env_state, 2 * jnp.ones((n_envs,)))
+    assert jnp.array_equal(observation, 2 * jnp.ones((n_envs,)))
+
+
+def test_rollout_factory_parallel():
+    agents = ("agent_0", "agent_1")
+
+    def env_step_fn(env_state, key, action):
+        env_state = env_state + 1
+        observation = {agent: env_state.astype(jnp.float32) for agent in agents}
+        reward = {agent: jnp.ones_like(action[agent]) for agent in agents}
+        done = {agent: jnp.zeros(env_state.shape, dtype=bool) for agent in agents}
+        return env_state, observation, reward, done
+
+    # the keys are split per agent
+    def explore_fn(state, key, observation):
+        assert set(key.keys()) == set(observation.keys())
+        action = {a: jnp.ones(o.shape, dtype=jnp.int32) for a, o in observation.items()}
+        log_prob = {a: jnp.zeros(o.shape + (1,)) for a, o in observation.items()}
+        return action, log_prob
+
+    n_envs = 4
+    rollout_fn = rollout_factory(explore_fn, env_step_fn, n_steps=5)
+
+    env_state = jnp.zeros((n_envs,), dtype=jnp.int32)
+    observation = {agent: jnp.zeros((n_envs,)) for agent in agents}
+    env_state, observation, experience = rollout_fn(
+        None, jax.random.key(0), env_state, observation
+    )
+
+    assert experience.observation["agent_0"].shape == (5, n_envs)
+    assert experience.log_prob["agent_1"].shape == (5, n_envs, 1)
+    assert jnp.array_equal(observation["agent_1"], 5 * jnp.ones((n_envs,)))
@@ -0,0 +1,30 @@
+import functools
+
+import jax
+import jax.numpy as jnp
+
+from kitae.loops.update import update_epochs
+
+
+def test_update_epochs():
+    # counts the steps, the info is the index of the epoch
+    def update_step_fn(state, key, experience):
+        jax.random.split(key)  # ensures that key has right shape
+        return state + experience, {"epoch": state.astype(jnp.float32)}
+
+    key = jax.random.key(0)
+    state = jnp.zeros((), dtype=jnp.int32)
+    experience = jnp.ones((), dtype=jnp.int32)
+
+    new_state, info = update_epochs(key, state, experience, update_step_fn, n_epochs=4)
+    assert new_state == 4
+    assert info["epoch"].shape == ()
+    assert jnp.allclose(info["epoch"], (0.0 + 1.0 + 2.0 + 3.0) / 4)
+
+    _update_epochs = jax.jit(
+        functools.partial(update_epochs, update_step_fn=update_step_fn),
+        static_argnames=("n_epochs",),
+    )
+    new_state, info = _update_epochs(key, state, experience, n_epochs=3)
+    assert new_state == 3
+    assert jnp.allclose(info["epoch"], 1.0)
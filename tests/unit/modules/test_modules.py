@@ -1,7 +1,13 @@
 import flax.linen as nn
+import gymnasium.spaces as spaces
+import jax
 import jax.numpy as jnp
+import numpy as np
 
+from kitae.modules.encoder import encoder_factory
 from kitae.modules.modules import parallel_copy
+from kitae.modules.policy import PolicyCategorical
+from kitae.modules.value import ValueOutput
 
 
 def test_parallel_copy():
@@ -23,3 +29,29 @@ def test_parallel_copy():
     assert jnp.array_equal(m3, x1 + x2)
     assert jnp.array_equal(m4, x1 + x2)
     assert jnp.array_equal(m5, x1 + x2)
+
+
+def test_encoder_factory_mixed_precision():
+    vector_space = spaces.Box(-1.0, 1.0, (4,), np.float32)
+    image_space = spaces.Box(0, 255, (84, 84, 4), np.uint8)
+
+    for observation_space in (vector_space, image_space):
+        encoder = encoder_factory(observation_space, dtype=jnp.bfloat16)()
+        x = jnp.ones((2,) + observation_space.shape, dtype=observation_space.dtype)
+
+        params = encoder.init(jax.random.key(0), x)
+        assert all(
+            leaf.dtype == jnp.float32 for leaf in jax.tree_util.tree_leaves(params)
+        )
+
+        hidden = encoder.apply(params, x)
+        assert hidden.dtype == jnp.bfloat16
+
+        # the heads stay float32, hence the losses
+        value = ValueOutput()
+        value_params = value.init(jax.random.key(1), hidden)
+        assert value.apply(value_params, hidden).dtype == jnp.float32
+
+        policy = PolicyCategorical(3)
+        policy_params = policy.init(jax.random.key(2), hidden)
+        assert policy.apply(policy_params, hidden).logits.dtype == jnp.float32
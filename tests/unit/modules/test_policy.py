@@ -0,0 +1,31 @@
+import distrax as dx
+import jax
+import jax.numpy as jnp
+
+from kitae.modules.policy import sample_and_log_prob, get_log_prob
+
+
+def test_categorical_sample_and_log_prob():
+    logits = jax.random.normal(jax.random.key(0), (10, 5))
+    dist = dx.Categorical(logits)
+
+    sample, log_prob = sample_and_log_prob(dist, jax.random.key(1))
+    assert sample.shape == (10,)
+    assert log_prob.shape == (10, 1)
+    assert jnp.allclose(log_prob[..., 0], dist.log_prob(sample), atol=1e-6)
+
+    _log_prob = get_log_prob(dist, sample)
+    assert _log_prob.shape == (10, 1)
+    assert jnp.allclose(_log_prob, log_prob, atol=1e-6)
+
+    _log_prob = get_log_prob(dist, sample.astype(jnp.float32))
+    assert jnp.allclose(_log_prob, log_prob, atol=1e-6)
+
+
+def test_normal_sample_and_log_prob():
+    dist = dx.Normal(jnp.zeros((10, 2)), jnp.ones((10, 2)))
+
+    sample, log_prob = sample_and_log_prob(dist, jax.random.key(0))
+    assert sample.shape == (10, 2)
+    assert log_prob.shape == (10, 1)
+    assert jnp.allclose(get_log_prob(dist, sample), log_prob, atol=1e-6)
@@ -0,0 +1,42 @@
+import distrax as dx
+import jax
+import jax.numpy as jnp
+
+from kitae.operations.loss import categorical_entropy
+from kitae.operations.loss import loss_policy_ppo
+
+
+def test_categorical_entropy():
+    logits = jax.random.normal(jax.random.key(0), (10, 5))
+
+    entropy = categorical_entropy(logits)
+    assert entropy.shape == (10,)
+    assert jnp.allclose(entropy, dx.Categorical(logits=logits).entropy(), atol=1e-6)
+
+    entropy = categorical_entropy(jnp.zeros((5,)))
+    assert jnp.allclose(entropy, jnp.log(5.0))
+
+    # masked actions
+    logits = jnp.array([0.0, 0.0, -jnp.inf])
+    entropy = categorical_entropy(logits)
+    assert not jnp.isnan(entropy)
+    assert jnp.allclose(entropy, jnp.log(2.0))
+    assert jnp.allclose(entropy, dx.Categorical(logits=logits).entropy())
+    assert not jnp.any(jnp.isnan(jax.grad(categorical_entropy)(logits)))
+
+
+def test_loss_policy_ppo():
+    key0, key1, key2 = jax.random.split(jax.random.key(0), 3)
+    log_probs = 0.5 * jax.random.normal(key0, (100, 1))
+    log_probs_old = 0.5 * jax.random.normal(key1, (100, 1))
+    gaes = jax.random.normal(key2, (100, 1))
+    dist = dx.Categorical(logits=jnp.zeros((100, 5)))
+    clip_eps = 0.2
+
+    loss, info = loss_policy_ppo(dist, log_probs, log_probs_old, gaes, clip_eps, 0.0)
+
+    ratios = jnp.exp(log_probs - log_probs_old)
+    ratios_clip = jnp.clip(ratios, 1 - clip_eps, 1 + clip_eps)
+    expected = -jnp.mean(jnp.minimum(ratios * gaes, ratios_clip * gaes))
+    assert jnp.allclose(loss, expected, atol=1e-6)
+    assert jnp.allclose(info.loss_policy, expected, atol=1e-6)
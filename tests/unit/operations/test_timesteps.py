@@ -0,0 +1,34 @@
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+from kitae.operations.timesteps import calculate_gaes_targets
+
+
+def test_calculate_gaes_targets():
+    key0, key1, key2 = jax.random.split(jax.random.key(0), 3)
+    values = jax.random.normal(key0, (20, 1))
+    next_values = jax.random.normal(key1, (20, 1))
+    rewards = jax.random.normal(key2, (20, 1))
+    discounts = 0.99 * jnp.ones((20, 1)).at[7].set(0.0)
+    _lambda = 0.95
+
+    gaes, targets = calculate_gaes_targets(
+        values, next_values, discounts, rewards, _lambda, False
+    )
+    assert gaes.shape == targets.shape == (20, 1)
+
+    expected_gaes = np.zeros((20, 1))
+    acc = np.zeros((1,))
+    for t in reversed(range(20)):
+        td_error = rewards[t] + discounts[t] * next_values[t] - values[t]
+        acc = td_error + discounts[t] * _lambda * acc
+        expected_gaes[t] = acc
+
+    assert np.allclose(gaes, expected_gaes, atol=1e-5)
+    assert np.allclose(targets, expected_gaes + values, atol=1e-5)
+
+    _gaes, _ = jax.jit(calculate_gaes_targets, static_argnums=(4, 5))(
+        values, next_values, discounts, rewards, _lambda, False
+    )
+    assert np.allclose(gaes, _gaes, atol=1e-6)
@@ -9,6 +9,8 @@ from kitae.buffer import jax_stack_experiences
 from kitae.buffer import numpy_stack_experiences
 from kitae.buffer import batchify
 from kitae.buffer import batchify_and_randomize
+from kitae.buffer import OffPolicyBuffer
+from kitae.buffer import OnPolicyBuffer
 
 
 def test_jax_stack_experiences():
@@ -219,3 +221,62 @@ def test_batchify_and_randomize():
 
     assert jnp.any(jnp.not_equal(batches_0[0], batches_1[0]))
     assert jnp.any(jnp.not_equal(batches_0[1], batches_1[1]))
+
+
+def make_experience(value: float, n_envs: int) -> Experience:
+    return Experience(
+        observation=value * np.ones((n_envs, 5)),
+        action=value * np.ones((n_envs,), dtype=np.int32),
+        reward=value * np.ones((n_envs,)),
+        done=np.zeros((n_envs,), dtype=bool),
+        next_observation=value * np.ones((n_envs, 5)),
+        log_prob=value * jnp.ones((n_envs, 1)),
+    )
+
+
+def test_on_policy_buffer():
+    with pytest.raises(ValueError):
+        OnPolicyBuffer(0, 0)
+
+    buffer = OnPolicyBuffer(0, 4)
+    assert len(buffer) == 0
+    with pytest.raises(ValueError):
+        buffer.sample()
+
+    for i in range(3):
+        buffer.add(make_experience(i, 2))
+    assert len(buffer) == 3
+
+    sample = buffer.sample()
+    assert isinstance(sample, Experience)
+    assert sample.observation.shape == (3, 2, 5)
+    assert sample.action.shape == (3, 2)
+    assert sample.action.dtype == np.int32
+    assert sample.done.dtype == bool
+    assert sample.log_prob.shape == (3, 2, 1)
+    assert np.array_equal(sample.observation[2], 2 * np.ones((2, 5)))
+    assert len(buffer) == 0
+
+    for i in range(4):
+        buffer.add(make_experience(i, 2))
+    with pytest.raises(IndexError):
+        buffer.add(make_experience(4, 2))
+
+    sample = buffer.sample()
+    assert sample.reward.shape == (4, 2)
+
+    buffer.add(make_experience(0, 2)._replace(observation={"a": np.ones((2, 5))}))
+    sample = buffer.sample()
+    assert sample.observation["a"].shape == (1, 2, 5)
+
+
+def test_off_policy_buffer():
+    buffer = OffPolicyBuffer(0, 10)
+    for i in range(5):
+        buffer.add(make_experience(i, 2))
+    assert len(buffer) == 5
+
+    sample = buffer.sample(3)
+    assert isinstance(sample, Experience)
+    assert sample.observation.shape == (3, 2, 5)
+    assert len(buffer) == 5